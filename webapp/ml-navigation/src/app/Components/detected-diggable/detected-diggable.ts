@@ -23,9 +23,43 @@ export interface DetectedDiggableData {
 export class DetectedDiggableComponent {
   @Input() diggables: DiggableObject[] = [];
 
+  // Cached table rows. Unlike obstacles, diggable orbs move (their x/y_meters
+  // are updated in place while being pushed), so validity checks both the
+  // object references and the coordinates they had when the rows were built.
+  private lastSource: DiggableObject[] = [];
+  private lastX: number[] = [];
+  private lastY: number[] = [];
+  private cachedRows: DetectedDiggableData[] | null = null;
+
   get detectedDiggables(): DetectedDiggableData[] {
+    const source = this.diggables;
+
+    if (this.cachedRows && this.sourceUnchanged(source)) {
+      return this.cachedRows;
+    }
+
+    this.lastSource = source.slice();
+    this.lastX = source.map(obj => obj.x_meters);
+    this.lastY = source.map(obj => obj.y_meters);
+    this.cachedRows = this.buildRows(source);
+    return this.cachedRows;
+  }
+
+  private sourceUnchanged(source: DiggableObject[]): boolean {
+    if (source.length !== this.lastSource.length) return false;
+    for (let i = 0; i < source.length; i++) {
+      if (source[i] !== this.lastSource[i] ||
+          source[i].x_meters !== this.lastX[i] ||
+          source[i].y_meters !== this.lastY[i]) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  private buildRows(source: DiggableObject[]): DetectedDiggableData[] {
     const maxDiggables = 10;
-    const detected: DetectedDiggableData[] = this.diggables.map(obj => {
+    const detected: DetectedDiggableData[] = source.map(obj => {
       // Extract number from name like "Regolith_5" -> "5"
       const number = obj.name?.split('_')[1] || '?';
 
@@ -19,9 +19,35 @@ export interface DetectedObstacle {
 export class DetectedObstacles {
   @Input() obstacles: CollidableObject[] = [];
 
+  // Cached table rows. The getter runs on every change-detection pass, so the
+  // rows are only rebuilt when the detection set itself changed — obstacle
+  // objects are immutable once placed, so reference equality is enough.
+  private lastSource: CollidableObject[] = [];
+  private cachedRows: DetectedObstacle[] | null = null;
+
   get detectedObstacles(): DetectedObstacle[] {
+    const source = this.obstacles;
+
+    if (this.cachedRows && this.sourceUnchanged(source)) {
+      return this.cachedRows;
+    }
+
+    this.lastSource = source.slice();
+    this.cachedRows = this.buildRows(source);
+    return this.cachedRows;
+  }
+
+  private sourceUnchanged(source: CollidableObject[]): boolean {
+    if (source.length !== this.lastSource.length) return false;
+    for (let i = 0; i < source.length; i++) {
+      if (source[i] !== this.lastSource[i]) return false;
+    }
+    return true;
+  }
+
+  private buildRows(source: CollidableObject[]): DetectedObstacle[] {
     const maxObstacles = 4;
-    const detected = this.obstacles.map(obj => {
+    const detected = source.map(obj => {
       // Calculate radius (special handling for column post)
       let radius: number;
       if (obj.radius_meters) {
@@ -1,12 +1,9 @@
 import { Component, inject, OnInit, OnDestroy } from '@angular/core';
 import { EnvironmentComponent } from '../../../environment/environment';
-import { WindowSizeService } from '../../services/window-size';
 import { App } from '../../app';
 import { Subscription } from 'rxjs';
 import p5 from 'p5';
 import { ResetTrigger } from '../../services/reset-trigger';
-import { ZoneDisplay } from '../zone_display/zone-display';
-import { ObstacleField } from '../obstacle_field/obstacle-field';
 import { Body } from 'matter-js';
 
 export class DiggableObject {
@@ -43,11 +40,9 @@ export class DiggableObject {
 })
 export class DiggingField implements OnInit, OnDestroy {
   environment = inject(EnvironmentComponent);
-  windowSizeService = inject(WindowSizeService);
   app = inject(App);
   resetTrigger = inject(ResetTrigger);
 
-  private windowSizeSubscription!: Subscription;
   private resetSubscription!: Subscription;
 
   // Diggable objects (regolith orbs) in the environment
@@ -59,16 +54,14 @@ export class DiggingField implements OnInit, OnDestroy {
   public minSpacing: number = 0.2;       // Min spacing between orbs (meters)
   public digModeEnabled: boolean = false; // Whether dig mode is active
 
+  // Scratch vector reused for per-tick carried-orb position writes; matter-js
+  // copies the components, so nothing retains a reference to it
+  private readonly scratchPosition = { x: 0, y: 0 };
+
   ngOnInit() {
     // Initialize diggable objects
     this.generateDiggables();
 
-    // Subscribe to window size changes (if needed for future updates)
-    this.windowSizeSubscription = this.windowSizeService.windowSize$.subscribe(() => {
-      // Currently diggables don't need to regenerate on resize
-      // But subscription is here if needed in the future
-    });
-
     // Subscribe to reset trigger to regenerate diggables on collision
     this.resetSubscription = this.resetTrigger.reset$.subscribe(() => {
       this.generateDiggables();
@@ -76,9 +69,6 @@ export class DiggingField implements OnInit, OnDestroy {
   }
 
   ngOnDestroy() {
-    if (this.windowSizeSubscription) {
-      this.windowSizeSubscription.unsubscribe();
-    }
     if (this.resetSubscription) {
       this.resetSubscription.unsubscribe();
     }
@@ -109,8 +99,8 @@ export class DiggingField implements OnInit, OnDestroy {
 
         // Create physics body for the orb (convert meters to pixels)
         if (this.environment.physicsEngine) {
-          const x_px = this.environment.metersToPixels(position.x);
-          const y_px = this.environment.environment_height_px - this.environment.metersToPixels(position.y);
+          const x_px = this.environment.metersToPixelsX(position.x);
+          const y_px = this.environment.metersToPixelsY(position.y);
           const radius_px = this.environment.metersToPixels(this.orbRadius);
 
           orb.physicsBody = this.environment.physicsEngine.addDiggable(
@@ -160,16 +150,16 @@ export class DiggingField implements OnInit, OnDestroy {
 
   // Check if a position overlaps with existing diggable objects or obstacles
   private hasOverlap(x: number, y: number, radius: number): boolean {
-    // Check overlap with existing diggable objects
+    // Check overlap with existing diggable objects. Compare squared distances
+    // throughout — the sqrt adds nothing to a threshold test.
     for (const obj of this.diggableObjects) {
       const dx = x - obj.x_meters;
       const dy = y - obj.y_meters;
-      const distance = Math.sqrt(dx * dx + dy * dy);
 
-      // Calculate required minimum distance (sum of radii + minimum spacing)
+      // Required minimum distance (sum of radii + minimum spacing)
       const minDistance = radius + obj.radius_meters + this.minSpacing;
 
-      if (distance < minDistance) {
+      if (dx * dx + dy * dy < minDistance * minDistance) {
         return true; // Overlap detected
       }
     }
@@ -180,7 +170,6 @@ export class DiggingField implements OnInit, OnDestroy {
       for (const obstacle of obstacleField.collidableObjects) {
         const dx = x - obstacle.x_meters;
         const dy = y - obstacle.y_meters;
-        const distance = Math.sqrt(dx * dx + dy * dy);
 
         // Calculate required minimum distance
         let obstacleRadius: number;
@@ -194,7 +183,7 @@ export class DiggingField implements OnInit, OnDestroy {
 
         const minDistance = radius + obstacleRadius + this.minSpacing;
 
-        if (distance < minDistance) {
+        if (dx * dx + dy * dy < minDistance * minDistance) {
           return true; // Overlap with obstacle detected
         }
       }
@@ -206,7 +195,6 @@ export class DiggingField implements OnInit, OnDestroy {
       for (const zoneObj of zoneDisplay.collidableObjects) {
         const dx = x - zoneObj.x_meters;
         const dy = y - zoneObj.y_meters;
-        const distance = Math.sqrt(dx * dx + dy * dy);
 
         // Calculate required minimum distance for zone objects
         let zoneObjRadius: number;
@@ -220,7 +208,7 @@ export class DiggingField implements OnInit, OnDestroy {
 
         const minDistance = radius + zoneObjRadius + this.minSpacing;
 
-        if (distance < minDistance) {
+        if (dx * dx + dy * dy < minDistance * minDistance) {
           return true; // Overlap with zone object detected
         }
       }
@@ -239,7 +227,7 @@ export class DiggingField implements OnInit, OnDestroy {
   public canGrab(): boolean {
     if (!this.environment.rover || !this.environment.physicsEngine) return false;
 
-    const roverState = this.environment.physicsEngine.getRoverState();
+    const roverState = this.environment.roverState;
     if (!roverState) return false;
 
     const roverX_px = roverState.x;
@@ -261,17 +249,13 @@ export class DiggingField implements OnInit, OnDestroy {
     const grabZoneX_px = roverX_px - Math.sin(roverAngle_rad) * grabZoneDistance_px;
     const grabZoneY_px = roverY_px + Math.cos(roverAngle_rad) * grabZoneDistance_px;
 
-    console.log(`Grab zone at (${grabZoneX_px.toFixed(1)}, ${grabZoneY_px.toFixed(1)}), size ${grabZoneWidth_px.toFixed(1)}x${grabZoneHeight_px.toFixed(1)}`);
-    console.log(`Rover at (${roverX_px.toFixed(1)}, ${roverY_px.toFixed(1)}), angle ${roverState.angle.toFixed(1)}°`);
-
     // Check each orb
-    let checkedCount = 0;
     for (const orb of this.diggableObjects) {
       if (orb.isPickedUp) continue; // Skip already picked up orbs
 
       // Get orb position in pixels
-      const orbX_px = this.environment.metersToPixels(orb.x_meters);
-      const orbY_px = this.environment.environment_height_px - this.environment.metersToPixels(orb.y_meters);
+      const orbX_px = this.environment.metersToPixelsX(orb.x_meters);
+      const orbY_px = this.environment.metersToPixelsY(orb.y_meters);
 
       // Calculate orb position relative to grab zone center
       const dx_px = orbX_px - grabZoneX_px;
@@ -281,20 +265,13 @@ export class DiggingField implements OnInit, OnDestroy {
       const localX_px = dx_px * Math.cos(-roverAngle_rad) - dy_px * Math.sin(-roverAngle_rad);
       const localY_px = dx_px * Math.sin(-roverAngle_rad) + dy_px * Math.cos(-roverAngle_rad);
 
-      checkedCount++;
-      if (checkedCount <= 3) {
-        console.log(`  Orb ${orb.name} at (${orbX_px.toFixed(1)}, ${orbY_px.toFixed(1)}) -> local (${localX_px.toFixed(1)}, ${localY_px.toFixed(1)})`);
-      }
-
       // Check if orb is within grab zone
       if (Math.abs(localX_px) <= grabZoneWidth_px / 2 &&
           Math.abs(localY_px) <= grabZoneHeight_px / 2) {
-        console.log(`  ✓ Orb ${orb.name} IS IN GRAB ZONE!`);
         return true; // At least one orb is in grab zone
       }
     }
 
-    console.log(`  Checked ${checkedCount} orbs, none in grab zone`);
     return false; // No orbs in grab zone
   }
 
@@ -302,7 +279,7 @@ export class DiggingField implements OnInit, OnDestroy {
   public grabOrbs() {
     if (!this.environment.rover || !this.environment.physicsEngine) return;
 
-    const roverState = this.environment.physicsEngine.getRoverState();
+    const roverState = this.environment.roverState;
     if (!roverState) return;
 
     const roverX_px = roverState.x;
@@ -329,8 +306,8 @@ export class DiggingField implements OnInit, OnDestroy {
       if (orb.isPickedUp) continue;
 
       // Get orb position in pixels
-      const orbX_px = this.environment.metersToPixels(orb.x_meters);
-      const orbY_px = this.environment.environment_height_px - this.environment.metersToPixels(orb.y_meters);
+      const orbX_px = this.environment.metersToPixelsX(orb.x_meters);
+      const orbY_px = this.environment.metersToPixelsY(orb.y_meters);
 
       // Calculate orb position relative to grab zone center
       const dx_px = orbX_px - grabZoneX_px;
@@ -352,8 +329,6 @@ export class DiggingField implements OnInit, OnDestroy {
         // Rotate to rover's local coordinates (inverse of current rotation)
         orb.pickupOffsetX = dx_px * Math.cos(-roverAngle_rad) - dy_px * Math.sin(-roverAngle_rad);
         orb.pickupOffsetY = dx_px * Math.sin(-roverAngle_rad) + dy_px * Math.cos(-roverAngle_rad);
-
-        console.log(`Grabbed orb: ${orb.name} at local offset (${orb.pickupOffsetX.toFixed(1)}, ${orb.pickupOffsetY.toFixed(1)})`);
       }
     }
   }
@@ -362,32 +337,39 @@ export class DiggingField implements OnInit, OnDestroy {
   private updatePickedUpOrbs() {
     if (!this.environment.physicsEngine) return;
 
-    const roverState = this.environment.physicsEngine.getRoverState();
+    const roverState = this.environment.roverState;
     if (!roverState) return;
 
     const roverX_px = roverState.x;
     const roverY_px = roverState.y;
     const roverAngle_rad = roverState.angle * Math.PI / 180;
 
+    // Hoist the rotation terms — they are the same for every carried orb
+    const cosAngle = Math.cos(roverAngle_rad);
+    const sinAngle = Math.sin(roverAngle_rad);
+
     for (const orb of this.diggableObjects) {
       if (!orb.isPickedUp) continue;
 
       // Rotate offset based on rover's current rotation
-      const rotatedOffsetX = orb.pickupOffsetX * Math.cos(roverAngle_rad) - orb.pickupOffsetY * Math.sin(roverAngle_rad);
-      const rotatedOffsetY = orb.pickupOffsetX * Math.sin(roverAngle_rad) + orb.pickupOffsetY * Math.cos(roverAngle_rad);
+      const rotatedOffsetX = orb.pickupOffsetX * cosAngle - orb.pickupOffsetY * sinAngle;
+      const rotatedOffsetY = orb.pickupOffsetX * sinAngle + orb.pickupOffsetY * cosAngle;
 
       // Calculate new position in pixels
       const newX_px = roverX_px + rotatedOffsetX;
       const newY_px = roverY_px + rotatedOffsetY;
 
-      // Update physics body position
+      // Update physics body position via the reused scratch vector —
+      // matter-js copies the components, so no per-orb allocation is needed
       if (orb.physicsBody) {
-        Body.setPosition(orb.physicsBody, { x: newX_px, y: newY_px });
+        this.scratchPosition.x = newX_px;
+        this.scratchPosition.y = newY_px;
+        Body.setPosition(orb.physicsBody, this.scratchPosition);
       }
 
       // Update stored position in meters for detection
       orb.x_meters = this.environment.pixelsToMeters(newX_px);
-      orb.y_meters = this.environment.pixelsToMeters(this.environment.environment_height_px - newY_px);
+      orb.y_meters = this.environment.pixelsToMetersY(newY_px);
     }
   }
 
@@ -412,17 +394,28 @@ export class DiggingField implements OnInit, OnDestroy {
           orb.isPickedUp = false;
           orb.pickupOffsetX = 0;
           orb.pickupOffsetY = 0;
-          console.log(`Released orb: ${orb.name} at (${orb.x_meters.toFixed(2)}, ${orb.y_meters.toFixed(2)})`);
         }
       }
     }
   }
 
   draw(p: p5) {
-    // Draw all regolith orbs using physics body positions
+    // Draw all regolith orbs using physics body positions. All orbs share a
+    // style, so set it once and only touch stroke/fill again if the color
+    // actually changes — the old per-orb push/style/pop pattern made five
+    // canvas state changes per orb per frame.
+    p.push();
+    p.strokeWeight(2);
+
+    let lastColor: string | null = null;
     for (const obj of this.diggableObjects) {
       const color = obj.color || '#8B4513';
-      const rgb = this.app.hexToRgb(color) ?? { r: 139, g: 69, b: 19 };
+      if (color !== lastColor) {
+        const rgb = this.app.hexToRgb(color) ?? { r: 139, g: 69, b: 19 };
+        p.stroke(rgb.r, rgb.g, rgb.b, 255);
+        p.fill(rgb.r, rgb.g, rgb.b, 255);
+        lastColor = color;
+      }
 
       // Get position from physics body if it exists
       let x_px: number;
@@ -435,22 +428,17 @@ export class DiggingField implements OnInit, OnDestroy {
 
         // Update meters position for detection
         obj.x_meters = this.environment.pixelsToMeters(x_px);
-        obj.y_meters = this.environment.pixelsToMeters(this.environment.environment_height_px - y_px);
+        obj.y_meters = this.environment.pixelsToMetersY(y_px);
       } else {
         // Fallback to stored position
-        x_px = this.environment.metersToPixels(obj.x_meters);
-        y_px = this.environment.environment_height_px - this.environment.metersToPixels(obj.y_meters);
+        x_px = this.environment.metersToPixelsX(obj.x_meters);
+        y_px = this.environment.metersToPixelsY(obj.y_meters);
       }
 
       const radius_px = this.environment.metersToPixels(obj.radius_meters);
-
-      // Draw circle
-      p.push();
-      p.stroke(rgb.r, rgb.g, rgb.b, 255);
-      p.fill(rgb.r, rgb.g, rgb.b, 255);
-      p.strokeWeight(2);
       p.circle(x_px, y_px, radius_px * 2); // p5.js circle uses diameter
-      p.pop();
     }
+
+    p.pop();
   }
 }
@@ -37,21 +37,42 @@ export class Frustum implements OnInit {
     // Component initialized
   }
 
-  update(p: p5) {
+  update() {
     // Clear previous detections
     this.detectedCollidableObjects = [];
     this.detectedDiggableObjects = [];
 
-    const state = this.environment.physicsEngine.getRoverState();
+    const state = this.environment.roverState;
     if (!state) return;
 
-    // Get collidable objects from obstacle field and zone display
-    const obstacleFieldObjects = this.environment.obstacleField?.collidableObjects || [];
+    // Get collidable objects from obstacle field and zone display. Iterate
+    // the source lists directly — spreading them into a combined array
+    // allocated ~12 objects' worth of garbage every tick.
+    const obstacleField = this.environment.obstacleField;
     const zoneDisplayObjects = this.environment.zoneDisplay?.collidableObjects || [];
-    const allCollidableObjects = [...obstacleFieldObjects, ...zoneDisplayObjects];
 
-    // Detect collidable objects within frustum
-    for (const obj of allCollidableObjects) {
+    // Detect field obstacles within the frustum. Broadphase runs over the
+    // packed SoA arrays (meters) — one flat distance test per obstacle — and
+    // only survivors get the full 8-point frustum test.
+    if (obstacleField) {
+      const roverXm = this.environment.pixelsToMeters(state.x);
+      const roverYm = this.environment.pixelsToMetersY(state.y);
+      const baseReach = Math.sqrt(this.depth * this.depth + (this.farWidth * this.farWidth) / 4);
+
+      for (let i = 0; i < obstacleField.obstacleCount; i++) {
+        const dx = obstacleField.obstacleX[i] - roverXm;
+        const dy = obstacleField.obstacleY[i] - roverYm;
+        const reach = baseReach + obstacleField.obstacleR[i];
+        if (dx * dx + dy * dy > reach * reach) continue;
+
+        const obj = obstacleField.collidableObjects[i];
+        if (this.isObjectInFrustum(obj, state.x, state.y, state.angle)) {
+          this.detectedCollidableObjects.push(obj);
+        }
+      }
+    }
+
+    for (const obj of zoneDisplayObjects) {
       if (this.isObjectInFrustum(obj, state.x, state.y, state.angle)) {
         this.detectedCollidableObjects.push(obj);
       }
@@ -74,8 +95,8 @@ export class Frustum implements OnInit {
     roverAngle: number
   ): boolean {
     // Convert object position from meters to pixels
-    const objXPx = (obj.x_meters / this.environment.environment_width_meters) * this.environment.environment_width_px;
-    const objYPx = this.environment.environment_height_px - ((obj.y_meters / this.environment.environment_height_meters) * this.environment.environment_height_px);
+    const objXPx = this.environment.metersToPixelsX(obj.x_meters);
+    const objYPx = this.environment.metersToPixelsY(obj.y_meters);
 
     // Get object radius in pixels
     let objectRadius = 0;
@@ -93,6 +114,17 @@ export class Frustum implements OnInit {
     const depthPx = this.environment.metersToPixels(this.depth);
     const farWidthPx = this.environment.metersToPixels(this.farWidth);
 
+    // Broadphase: reject objects that can't possibly reach the frustum. The
+    // farthest frustum point from the rover is the far corner, so anything
+    // beyond that distance (plus the object's own radius) is out, and we skip
+    // the 8-point boundary test below entirely.
+    const dxCenter = objXPx - roverX;
+    const dyCenter = objYPx - roverY;
+    const maxReach = Math.sqrt(depthPx * depthPx + (farWidthPx * farWidthPx) / 4) + objectRadius;
+    if (dxCenter * dxCenter + dyCenter * dyCenter > maxReach * maxReach) {
+      return false;
+    }
+
     // Rotate to rover's local space (inverse rotation)
     const angleRad = -(roverAngle * Math.PI / 180);
 
@@ -132,7 +164,7 @@ export class Frustum implements OnInit {
   draw(p: p5) {
     if (!this.environment.rover) return;
 
-    const state = this.environment.physicsEngine.getRoverState();
+    const state = this.environment.roverState;
     if (!state) return;
 
     const { x, y, angle } = state;
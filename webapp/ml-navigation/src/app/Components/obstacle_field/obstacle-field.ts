@@ -1,12 +1,11 @@
 import { Component, inject, OnInit, OnDestroy } from '@angular/core';
 import { EnvironmentComponent } from '../../../environment/environment';
-import { WindowSizeService } from '../../services/window-size';
 import { App } from '../../app';
 import { CollidableObject, CollisionShape } from '../collidable-object/collidable-object';
 import { Subscription } from 'rxjs';
-import { ZoneDisplay } from '../zone_display/zone-display';
 import p5 from 'p5';
 import { ResetTrigger } from '../../services/reset-trigger';
+import { ObstacleSync } from '../../services/obstacle-sync';
 
 @Component({
   selector: 'app-obstacle-field',
@@ -16,16 +15,23 @@ import { ResetTrigger } from '../../services/reset-trigger';
 })
 export class ObstacleField implements OnInit, OnDestroy {
   environment = inject(EnvironmentComponent);
-  windowSizeService = inject(WindowSizeService);
   app = inject(App);
   resetTrigger = inject(ResetTrigger);
+  obstacleSync = inject(ObstacleSync);
 
-  private windowSizeSubscription!: Subscription;
   private resetSubscription!: Subscription;
 
   // Collidable objects (obstacles) in the environment
   public collidableObjects: CollidableObject[] = [];
 
+  // Structure-of-arrays mirror of the circular obstacles (positions/radii in
+  // meters). Hot loops iterate these flat typed arrays instead of chasing
+  // object references through collidableObjects.
+  public obstacleX: Float32Array = new Float32Array(0);
+  public obstacleY: Float32Array = new Float32Array(0);
+  public obstacleR: Float32Array = new Float32Array(0);
+  public obstacleCount: number = 0;
+
   // Obstacle generation settings
   public numRocks: number = 7;           // Number of rocks to generate
   public numCraters: number = 4;         // Number of craters to generate
@@ -35,6 +41,22 @@ export class ObstacleField implements OnInit, OnDestroy {
   public craterMaxRadius: number = 0.25; // Max radius for craters (0.5m diameter)
   public minSpacing: number = 0.666;       // Min spacing between obstacles (meters) - allows rover to pass
 
+  // Uniform grid over the arena for placement overlap queries. The cell size
+  // is the largest possible interaction distance (two max radii plus spacing),
+  // so a candidate position only has to test the 3x3 block of cells around its
+  // own instead of every placed obstacle.
+  private readonly hashCellSize = this.craterMaxRadius * 2 + this.minSpacing;
+  private spatialHash: Map<number, number[]> = new Map();
+
+  // Per-obstacle render data: pixel coordinates, diameters, and parsed colors.
+  // Computed when obstacles regenerate or the canvas is rescaled, so draw()
+  // does no unit conversion or color parsing per frame.
+  private renderXPx = new Float32Array(0);
+  private renderYPx = new Float32Array(0);
+  private renderDPx = new Float32Array(0);
+  private renderColors: { r: number; g: number; b: number }[] = [];
+  private renderEnvHeightPx = -1; // canvas scale the render data was built for
+
   // Zone dimensions from zone-display (for determining allowed zones)
   private startingZone_width_meters: number = 2;
   private startingZone_height_meters: number = 2;
@@ -45,12 +67,6 @@ export class ObstacleField implements OnInit, OnDestroy {
     // Initialize obstacles
     this.generateObstacles();
 
-    // Subscribe to window size changes (if needed for future updates)
-    this.windowSizeSubscription = this.windowSizeService.windowSize$.subscribe(({ width, height }) => {
-      // Currently obstacles don't need to regenerate on resize
-      // But subscription is here if needed in the future
-    });
-
     // Subscribe to reset trigger to regenerate obstacles on collision
     this.resetSubscription = this.resetTrigger.reset$.subscribe(() => {
       this.generateObstacles();
@@ -58,9 +74,6 @@ export class ObstacleField implements OnInit, OnDestroy {
   }
 
   ngOnDestroy() {
-    if (this.windowSizeSubscription) {
-      this.windowSizeSubscription.unsubscribe();
-    }
     if (this.resetSubscription) {
       this.resetSubscription.unsubscribe();
     }
@@ -71,6 +84,15 @@ export class ObstacleField implements OnInit, OnDestroy {
     this.collidableObjects = [];
     const maxAttempts = 100; // Max attempts per obstacle to find valid position
 
+    // Reset the packed arrays with capacity for every obstacle we may place
+    const capacity = this.numRocks + this.numCraters;
+    this.obstacleX = new Float32Array(capacity);
+    this.obstacleY = new Float32Array(capacity);
+    this.obstacleR = new Float32Array(capacity);
+    this.obstacleCount = 0;
+    this.spatialHash.clear();
+    this.renderEnvHeightPx = -1; // force render-data rebuild on next draw
+
     // Generate rocks
     for (let i = 0; i < this.numRocks; i++) {
       const radius = this.app.randomInRange(this.rockMinRadius, this.rockMaxRadius);
@@ -86,6 +108,7 @@ export class ObstacleField implements OnInit, OnDestroy {
           name: `Rock_${i}`
         });
         this.collidableObjects.push(rock);
+        this.packObstacle(position.x, position.y, radius);
       }
     }
 
@@ -104,8 +127,35 @@ export class ObstacleField implements OnInit, OnDestroy {
           name: `Crater_${i}`
         });
         this.collidableObjects.push(crater);
+        this.packObstacle(position.x, position.y, radius);
       }
     }
+
+    // Announce the finished layout so physics consumers rebuild their bodies
+    this.obstacleSync.notifyGenerated();
+  }
+
+  // Append an obstacle to the packed SoA arrays and index it in the hash grid
+  private packObstacle(x: number, y: number, radius: number) {
+    const index = this.obstacleCount;
+    this.obstacleX[index] = x;
+    this.obstacleY[index] = y;
+    this.obstacleR[index] = radius;
+    this.obstacleCount++;
+
+    const key = this.hashKey(x, y);
+    const bucket = this.spatialHash.get(key);
+    if (bucket) {
+      bucket.push(index);
+    } else {
+      this.spatialHash.set(key, [index]);
+    }
+  }
+
+  // Map a position to its grid cell key
+  private hashKey(x: number, y: number): number {
+    const cols = Math.ceil(this.environment.environment_width_meters / this.hashCellSize) + 2;
+    return (Math.floor(y / this.hashCellSize) + 1) * cols + Math.floor(x / this.hashCellSize) + 1;
   }
 
   // Find position for an obstacle (no overlap with existing) within excavation or obstacle zones
@@ -156,50 +206,69 @@ export class ObstacleField implements OnInit, OnDestroy {
 
   // Check if a position overlaps with existing collidable objects
   private hasOverlap(x: number, y: number, radius: number): boolean {
-    for (const obj of this.collidableObjects) {
-      const dx = x - obj.x_meters;
-      const dy = y - obj.y_meters;
-      const distance = Math.sqrt(dx * dx + dy * dy);
-
-      // Calculate required minimum distance (sum of radii + minimum spacing)
-      let minDistance: number;
-      if (obj.isCircular() && obj.radius_meters) {
-        minDistance = radius + obj.radius_meters + this.minSpacing;
-      } else {
-        continue;
-      }
-
-      if (distance < minDistance) {
-        return true; // Overlap detected
+    // Only the 3x3 block of hash cells around the candidate can contain an
+    // obstacle close enough to violate spacing
+    const cols = Math.ceil(this.environment.environment_width_meters / this.hashCellSize) + 2;
+    const cellX = Math.floor(x / this.hashCellSize) + 1;
+    const cellY = Math.floor(y / this.hashCellSize) + 1;
+
+    for (let cy = cellY - 1; cy <= cellY + 1; cy++) {
+      for (let cx = cellX - 1; cx <= cellX + 1; cx++) {
+        const bucket = this.spatialHash.get(cy * cols + cx);
+        if (!bucket) continue;
+
+        for (const i of bucket) {
+          const dx = x - this.obstacleX[i];
+          const dy = y - this.obstacleY[i];
+
+          // Required minimum distance (sum of radii + minimum spacing);
+          // compare squared so no sqrt is needed
+          const minDistance = radius + this.obstacleR[i] + this.minSpacing;
+
+          if (dx * dx + dy * dy < minDistance * minDistance) {
+            return true; // Overlap detected
+          }
+        }
       }
     }
 
     return false; // No overlap
   }
 
-  update(p: p5) {
+  // Convert obstacle positions/colors into ready-to-draw pixel values
+  private computeRenderData() {
+    const count = this.collidableObjects.length;
+    this.renderXPx = new Float32Array(count);
+    this.renderYPx = new Float32Array(count);
+    this.renderDPx = new Float32Array(count);
+    this.renderColors.length = 0;
+
+    for (let i = 0; i < count; i++) {
+      const obj = this.collidableObjects[i];
+      this.renderXPx[i] = this.environment.metersToPixelsX(obj.x_meters);
+      this.renderYPx[i] = this.environment.metersToPixelsY(obj.y_meters); // Flip Y
+      this.renderDPx[i] = this.environment.metersToPixels(obj.radius_meters ?? 0) * 2;
+      this.renderColors.push(this.app.hexToRgb(obj.color || '#000000') ?? { r: 0, g: 0, b: 0 });
+    }
+
+    this.renderEnvHeightPx = this.environment.environment_height_px;
   }
 
   draw(p: p5) {
-    // Draw all obstacles (rocks and craters)
-    for (const obj of this.collidableObjects) {
-      if (!obj.isCircular() || !obj.radius_meters) continue;
-
-      const color = obj.color || '#000000';
-      const rgb = this.app.hexToRgb(color) ?? { r: 0, g: 0, b: 0 };
-
-      // Convert meters to pixels
-      const x_px = this.environment.metersToPixels(obj.x_meters);
-      const y_px = this.environment.environment_height_px - this.environment.metersToPixels(obj.y_meters); // Flip Y
-      const radius_px = this.environment.metersToPixels(obj.radius_meters);
+    // Rebuild render data after regeneration or a canvas rescale
+    if (this.renderEnvHeightPx !== this.environment.environment_height_px) {
+      this.computeRenderData();
+    }
 
-      // Draw circle
-      p.push();
+    // Draw all obstacles (rocks and craters)
+    p.push();
+    p.strokeWeight(2);
+    for (let i = 0; i < this.renderColors.length; i++) {
+      const rgb = this.renderColors[i];
       p.stroke(rgb.r, rgb.g, rgb.b, 255);
       p.fill(rgb.r, rgb.g, rgb.b, 255);
-      p.strokeWeight(2);
-      p.circle(x_px, y_px, radius_px * 2); // p5.js circle uses diameter
-      p.pop();
+      p.circle(this.renderXPx[i], this.renderYPx[i], this.renderDPx[i]); // p5.js circle uses diameter
     }
+    p.pop();
   }
 }
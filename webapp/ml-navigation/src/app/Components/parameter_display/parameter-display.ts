@@ -18,20 +18,37 @@ export class ParameterDisplay {
   @Input() color: string = '#1a73e8';
   @Input() pillBgOpacity: number = 0.12;
 
-  get pillBackground(): string {
+  // The style getters are evaluated on every change-detection pass, but their
+  // inputs almost never change — parse the color once and hand back the same
+  // rgba strings until color/opacity actually differ
+  private cachedColor = '';
+  private cachedOpacity = -1;
+  private cachedPillBackground = '';
+  private cachedItemPillBackground = '';
+
+  private refreshBackgrounds() {
     const hex = this.color.replace('#', '');
     const r = parseInt(hex.substring(0, 2), 16);
     const g = parseInt(hex.substring(2, 4), 16);
     const b = parseInt(hex.substring(4, 6), 16);
-    return `rgba(${r}, ${g}, ${b}, ${this.pillBgOpacity})`;
+    this.cachedPillBackground = `rgba(${r}, ${g}, ${b}, ${this.pillBgOpacity})`;
+    this.cachedItemPillBackground = `rgba(${r}, ${g}, ${b}, 0.08)`;
+    this.cachedColor = this.color;
+    this.cachedOpacity = this.pillBgOpacity;
+  }
+
+  get pillBackground(): string {
+    if (this.cachedColor !== this.color || this.cachedOpacity !== this.pillBgOpacity) {
+      this.refreshBackgrounds();
+    }
+    return this.cachedPillBackground;
   }
 
   get itemPillBackground(): string {
-    const hex = this.color.replace('#', '');
-    const r = parseInt(hex.substring(0, 2), 16);
-    const g = parseInt(hex.substring(2, 4), 16);
-    const b = parseInt(hex.substring(4, 6), 16);
-    return `rgba(${r}, ${g}, ${b}, 0.08)`;
+    if (this.cachedColor !== this.color || this.cachedOpacity !== this.pillBgOpacity) {
+      this.refreshBackgrounds();
+    }
+    return this.cachedItemPillBackground;
   }
 
   isSeparator(param: Parameter): boolean {
@@ -4,11 +4,15 @@ import { WindowSizeService } from '../../services/window-size';
 import { Subscription } from 'rxjs';
 import { EnvironmentComponent } from '../../../environment/environment';
 import p5 from 'p5';
-import { App } from '../../app';
 import { ResetTrigger } from '../../services/reset-trigger';
+import { ObstacleSync } from '../../services/obstacle-sync';
 import { Body } from 'matter-js';
 import { Zone } from '../../enums/zone.enum';
 
+// Keys the drive loop polls each tick; all other keys are dropped at the
+// event handler so they never enter the pressed-key set
+const CONTROL_KEYS = new Set(['w', 'a', 's', 'd']);
+
 @Component({
   selector: 'app-rover',
   standalone: true,
@@ -18,10 +22,11 @@ import { Zone } from '../../enums/zone.enum';
 export class RoverComponent implements OnInit, OnDestroy {
   private windowSizeSubscription!: Subscription;
   private resetSubscription!: Subscription;
+  private obstacleSubscription!: Subscription;
   private physicsBody!: Body;
   environment = inject(EnvironmentComponent);
-  app = inject(App);
   ResetTrigger = inject(ResetTrigger);
+  obstacleSync = inject(ObstacleSync);
 
   // Properties
   window_width!: number;
@@ -80,6 +85,14 @@ export class RoverComponent implements OnInit, OnDestroy {
   // Zone tracking
   public currentZone: Zone = Zone.NONE;
 
+  // Offscreen cache of the rover artwork. The body/wheels/bucket shapes only
+  // change on resize, so they are rendered once into this sprite and the
+  // per-frame draw is a translate/rotate plus one image() blit.
+  private roverSprite: p5.Graphics | null = null;
+  private spriteValid = false;
+  private spriteMinX = 0; // rover-local coordinate of the sprite's top-left
+  private spriteMinY = 0;
+
   set speedMultiplier(value: number) {
     const isKeyOverride = this.pressedKeys.has('w') || this.pressedKeys.has('s');
     const isDisplayUpdate = Math.abs(value - this._speedMultiplier) < 0.01;
@@ -171,6 +184,9 @@ export class RoverComponent implements OnInit, OnDestroy {
 
     // Calculate bounding box that encompasses all visual elements
     this.calculateBoundingBox();
+
+    // Geometry changed — rebuild the cached sprite on next draw
+    this.spriteValid = false;
   }
 
   private calculateBoundingBox() {
@@ -236,8 +252,12 @@ export class RoverComponent implements OnInit, OnDestroy {
       this.environment.environment_height_px
     );
 
-    // Add obstacles from obstacle field and zone display
-    this.setupPhysicsObstacles();
+    // Rebuild physics obstacles whenever the obstacle field publishes a
+    // layout — covers the initial generation and every collision reset,
+    // without timer-based guessing about component init order
+    this.obstacleSubscription = this.obstacleSync.generated$.subscribe(() => {
+      this.setupPhysicsObstacles();
+    });
 
     // Set collision callback to trigger reset
     this.environment.physicsEngine.setCollisionCallback(() => {
@@ -259,45 +279,38 @@ export class RoverComponent implements OnInit, OnDestroy {
   }
 
   private setupPhysicsObstacles() {
-    // Wait for components to be initialized
-    setTimeout(() => {
-      // Clear any existing obstacles first
-      this.environment.physicsEngine.clearObstacles();
-
-      // Get obstacles from obstacle field
-      const obstacles = this.environment.obstacleField?.collidableObjects || [];
-      console.log('Adding obstacles to physics:', obstacles.length);
-
-      obstacles.forEach(obstacle => {
-        // Convert from meters to pixels (x_meters is distance from left, y_meters from bottom)
-        const x = (obstacle.x_meters / this.environment.environment_width_meters) * this.environment.environment_width_px;
-        const y = this.environment.environment_height_px - ((obstacle.y_meters / this.environment.environment_height_meters) * this.environment.environment_height_px);
-
-        if (obstacle.isCircular() && obstacle.radius_meters) {
-          const radius = this.environment.metersToPixels(obstacle.radius_meters);
-          const label = obstacle.name?.toLowerCase().includes('crater') ? 'crater' :
-                       obstacle.name?.toLowerCase().includes('rock') ? 'rock' : 'obstacle';
-          console.log(`Adding ${label} at (${x}, ${y}) with radius ${radius}`);
-          this.environment.physicsEngine.addObstacle(x, y, radius, label);
-        }
-      });
-
-      // Get column post from zone display
-      const zoneObjects = this.environment.zoneDisplay?.collidableObjects || [];
-      console.log('Adding zone objects to physics:', zoneObjects.length);
-
-      zoneObjects.forEach(obj => {
-        if (obj.isRectangular() && obj.width_meters && obj.height_meters) {
-          // Column post position (center)
-          const x = (obj.x_meters / this.environment.environment_width_meters) * this.environment.environment_width_px;
-          const y = this.environment.environment_height_px - ((obj.y_meters / this.environment.environment_height_meters) * this.environment.environment_height_px);
-          const width = this.environment.metersToPixels(obj.width_meters);
-          const height = this.environment.metersToPixels(obj.height_meters);
-          console.log(`Adding column at (${x}, ${y}) with size ${width}x${height}`);
-          this.environment.physicsEngine.addRectangleObstacle(x, y, width, height, 'column');
-        }
-      });
-    }, 200); // Slightly longer delay to ensure all components are fully initialized
+    // Clear any existing obstacles first
+    this.environment.physicsEngine.clearObstacles();
+
+    // Get obstacles from obstacle field
+    const obstacles = this.environment.obstacleField?.collidableObjects || [];
+
+    obstacles.forEach(obstacle => {
+      // Convert from meters to pixels (x_meters is distance from left, y_meters from bottom)
+      const x = this.environment.metersToPixelsX(obstacle.x_meters);
+      const y = this.environment.metersToPixelsY(obstacle.y_meters);
+
+      if (obstacle.isCircular() && obstacle.radius_meters) {
+        const radius = this.environment.metersToPixels(obstacle.radius_meters);
+        const label = obstacle.name?.toLowerCase().includes('crater') ? 'crater' :
+                     obstacle.name?.toLowerCase().includes('rock') ? 'rock' : 'obstacle';
+        this.environment.physicsEngine.addObstacle(x, y, radius, label);
+      }
+    });
+
+    // Get column post from zone display
+    const zoneObjects = this.environment.zoneDisplay?.collidableObjects || [];
+
+    zoneObjects.forEach(obj => {
+      if (obj.isRectangular() && obj.width_meters && obj.height_meters) {
+        // Column post position (center)
+        const x = this.environment.metersToPixelsX(obj.x_meters);
+        const y = this.environment.metersToPixelsY(obj.y_meters);
+        const width = this.environment.metersToPixels(obj.width_meters);
+        const height = this.environment.metersToPixels(obj.height_meters);
+        this.environment.physicsEngine.addRectangleObstacle(x, y, width, height, 'column');
+      }
+    });
   }
 
   private resetRoverPosition() {
@@ -311,8 +324,8 @@ export class RoverComponent implements OnInit, OnDestroy {
       this.environment.rover_start_rotation
     );
 
-    // Re-setup physics obstacles with newly regenerated positions
-    this.setupPhysicsObstacles();
+    // Physics obstacles are rebuilt via the ObstacleSync handshake once the
+    // obstacle field finishes regenerating — no call needed here
 
     // Reset speed and target
     this._speedMultiplier = 0;
@@ -327,9 +340,12 @@ export class RoverComponent implements OnInit, OnDestroy {
     if (this.resetSubscription) {
       this.resetSubscription.unsubscribe();
     }
+    if (this.obstacleSubscription) {
+      this.obstacleSubscription.unsubscribe();
+    }
   }
 
-  update(p: p5) {
+  update() {
     const rotationModifier = this._speedMultiplier >= 0 ? 1 : -1;
 
     // Zone-based behavior logic can be implemented here using this.currentZone
@@ -380,42 +396,66 @@ export class RoverComponent implements OnInit, OnDestroy {
     this.environment.physicsEngine.setRoverAngularVelocity(angularVelocity);
   }
 
+  // Render the body, wheels, and bucket into the offscreen sprite. The sprite
+  // is sized to the visual bounding box plus stroke padding, and drawn in
+  // rover-local coordinates shifted so everything lands inside the buffer.
+  private renderRoverSprite(p: p5) {
+    const pad = this.Rover_Stroke_Thickness * 2;
+    this.spriteMinX = this.BoundingBox_OffsetX - this.BoundingBox_Left - pad;
+    this.spriteMinY = this.BoundingBox_OffsetY - this.BoundingBox_Top - pad;
+    const spriteWidth = this.BoundingBox_Left + this.BoundingBox_Right + pad * 2;
+    const spriteHeight = this.BoundingBox_Top + this.BoundingBox_Bottom + pad * 2;
+
+    this.roverSprite?.remove();
+    const g = p.createGraphics(Math.ceil(spriteWidth), Math.ceil(spriteHeight));
+    g.clear();
+    g.translate(-this.spriteMinX, -this.spriteMinY);
+
+    // All rover parts share the same stroke — set it once, vary only the fill
+    g.strokeWeight(this.Rover_Stroke_Thickness);
+    g.stroke(this.Rover_Stroke_Color);
+
+    // Rover Body
+    g.fill(100, 100, 100);
+    g.rect(-this.Rover_Width / 2, -this.Rover_Height / 2, this.Rover_Width, this.Rover_Height, this.Rover_Radius);
+
+    // Wheels
+    g.fill(25, 25, 25);
+    g.rect(this.Wheel_Left_X, this.Wheel_Front_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+    g.rect(this.Wheel_Left_X, this.Wheel_Middle_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+    g.rect(this.Wheel_Left_X, this.Wheel_Back_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+    g.rect(this.Wheel_Right_X, this.Wheel_Front_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+    g.rect(this.Wheel_Right_X, this.Wheel_Middle_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+    g.rect(this.Wheel_Right_X, this.Wheel_Back_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
+
+    // Front Digging Bucket
+    g.fill(150, 150, 150);
+    g.rect(this.Bucket_Arm_Left_X, this.Bucket_Arm_Y, this.Bucket_Arm_Width, this.Bucket_Arm_Height, this.Rover_Radius);
+    g.rect(this.Bucket_Arm_Right_X, this.Bucket_Arm_Y, this.Bucket_Arm_Width, this.Bucket_Arm_Height, this.Rover_Radius);
+    g.rect(this.Bucket_X, this.Bucket_Y, this.Bucket_Width, this.Bucket_Height, this.Bucket_Top_Radius, this.Bucket_Top_Radius, this.Bucket_Bottom_Radius, this.Bucket_Bottom_Radius);
+
+    this.roverSprite = g;
+    this.spriteValid = true;
+  }
+
   draw(p: p5) {
     if (!this.physicsBody) return;
 
-    const state = this.environment.physicsEngine.getRoverState();
+    const state = this.environment.roverState;
     if (!state) return;
 
     const { x, y, angle } = state;
 
+    if (!this.spriteValid || !this.roverSprite) {
+      this.renderRoverSprite(p);
+    }
+
     p.push();
     p.translate(x, y);
     p.rotate(angle);
 
-    // Rover Body
-    p.fill(100, 100, 100);
-    p.strokeWeight(this.Rover_Stroke_Thickness);
-    p.stroke(this.Rover_Stroke_Color);
-    p.rect(-this.Rover_Width / 2, -this.Rover_Height / 2, this.Rover_Width, this.Rover_Height, this.Rover_Radius);
-
-    // Wheels
-    p.fill(25, 25, 25);
-    p.strokeWeight(this.Rover_Stroke_Thickness);
-    p.stroke(this.Rover_Stroke_Color);
-    p.rect(this.Wheel_Left_X, this.Wheel_Front_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-    p.rect(this.Wheel_Left_X, this.Wheel_Middle_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-    p.rect(this.Wheel_Left_X, this.Wheel_Back_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-    p.rect(this.Wheel_Right_X, this.Wheel_Front_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-    p.rect(this.Wheel_Right_X, this.Wheel_Middle_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-    p.rect(this.Wheel_Right_X, this.Wheel_Back_Y, this.Wheel_Width, this.Wheel_Height, this.Rover_Radius);
-
-    // Front Digging Bucket
-    p.fill(150, 150, 150);
-    p.strokeWeight(this.Rover_Stroke_Thickness);
-    p.stroke(this.Rover_Stroke_Color);
-    p.rect(this.Bucket_Arm_Left_X, this.Bucket_Arm_Y, this.Bucket_Arm_Width, this.Bucket_Arm_Height, this.Rover_Radius);
-    p.rect(this.Bucket_Arm_Right_X, this.Bucket_Arm_Y, this.Bucket_Arm_Width, this.Bucket_Arm_Height, this.Rover_Radius);
-    p.rect(this.Bucket_X, this.Bucket_Y, this.Bucket_Width, this.Bucket_Height, this.Bucket_Top_Radius, this.Bucket_Top_Radius, this.Bucket_Bottom_Radius, this.Bucket_Bottom_Radius);
+    // Blit the cached artwork at its rover-local offset
+    p.image(this.roverSprite!, this.spriteMinX, this.spriteMinY);
 
     // Draw bounding box if enabled
     if (this.showBoundingBox) {
@@ -446,10 +486,19 @@ export class RoverComponent implements OnInit, OnDestroy {
   }
 
   keyPressed(event: KeyboardEvent) {
-    this.pressedKeys.add(event.key.toLowerCase());
+    // OS auto-repeat refires keydown while a key is held; the key is already
+    // in the set, so skip the lowercasing and re-add
+    if (event.repeat) return;
+    const key = event.key.toLowerCase();
+    if (CONTROL_KEYS.has(key)) {
+      this.pressedKeys.add(key);
+    }
   }
 
   keyReleased(event: KeyboardEvent) {
-    this.pressedKeys.delete(event.key.toLowerCase());
+    const key = event.key.toLowerCase();
+    if (CONTROL_KEYS.has(key)) {
+      this.pressedKeys.delete(key);
+    }
   }
 }
\ No newline at end of file
@@ -1,5 +1,5 @@
 import { Component, inject } from '@angular/core';
-import p5, { Color } from 'p5';
+import p5 from 'p5';
 import { Subscription } from 'rxjs';
 import { EnvironmentComponent } from '../../../environment/environment';
 import { WindowSizeService } from '../../../app/services/window-size';
@@ -21,7 +21,6 @@ export class ZoneDisplay {
   app = inject(App);
 
   //2x2m region in bottom left of environment
-  private p5Instance!: p5;
   private windowSizeSubscription!: Subscription;
 
   // Collidable objects in the environment
@@ -73,6 +72,19 @@ export class ZoneDisplay {
   public currentZone: Zone = Zone.NONE;
   public previousZone: Zone = Zone.NONE;
 
+  // Offscreen cache of the zone artwork. The zones never move, so they are
+  // rendered once into this buffer and blitted each frame; resize invalidates
+  private zoneLayer: p5.Graphics | null = null;
+  private zoneLayerValid = false;
+
+  // Zone colors parsed once — the hex constants never change, so there is no
+  // reason to re-run hexToRgb for each zone on every frame
+  private readonly rgb_startingZone = this.app.hexToRgb(this.startingZone_color) ?? { r: 0, g: 0, b: 0 };
+  private readonly rgb_excavationZone = this.app.hexToRgb(this.excavationZone_color) ?? { r: 0, g: 0, b: 0 };
+  private readonly rgb_obstacleZone = this.app.hexToRgb(this.obstacleZone_color) ?? { r: 0, g: 0, b: 0 };
+  private readonly rgb_constructionZone = this.app.hexToRgb(this.constructionZone_color) ?? { r: 0, g: 0, b: 0 };
+  private readonly rgb_targetbermZone = this.app.hexToRgb(this.targetbermZone_color) ?? { r: 0, g: 0, b: 0 };
+
   ngOnInit() {
     // Initialize collidable objects
     this.initializeCollidableObjects();
@@ -103,6 +115,9 @@ export class ZoneDisplay {
       //Column Post Zone
       this.columnZone_width_px = this.environment.metersToPixels(this.columnZone_width_meters);
       this.columnZone_height_px = this.environment.metersToPixels(this.columnZone_height_meters);
+
+      // Zone geometry changed — re-render the cached layer on next draw
+      this.zoneLayerValid = false;
     });
   }
 
@@ -165,14 +180,14 @@ export class ZoneDisplay {
     return Zone.NONE;
   }
 
-  update(p: p5) {
+  update() {
     // Get rover position
     if (this.environment.rover) {
-      const roverState = this.environment.physicsEngine.getRoverState();
+      const roverState = this.environment.roverState;
       if (roverState) {
         // Convert rover position from pixels to meters
         const roverX_meters = this.environment.pixelsToMeters(roverState.x);
-        const roverY_meters = this.environment.pixelsToMeters(this.environment.environment_height_px - roverState.y);
+        const roverY_meters = this.environment.pixelsToMetersY(roverState.y);
 
         // Detect current zone
         this.previousZone = this.currentZone;
@@ -180,16 +195,47 @@ export class ZoneDisplay {
 
         // Update rover's currentZone property
         this.environment.rover.currentZone = this.currentZone;
-
-        // Log zone changes
-        if (this.currentZone !== this.previousZone) {
-          console.log(`Rover entered zone: ${this.currentZone}`);
-        }
       }
     }
   }
 
+  // Draw a single zone rectangle with the given stroke/fill colors and alphas
+  private drawZoneRect(
+    p: p5 | p5.Graphics,
+    stroke: { r: number; g: number; b: number },
+    strokeAlpha: number,
+    fill: { r: number; g: number; b: number },
+    fillAlpha: number,
+    x: number,
+    y: number,
+    w: number,
+    h: number,
+    radius: number
+  ) {
+    p.stroke(stroke.r, stroke.g, stroke.b, strokeAlpha);
+    p.fill(fill.r, fill.g, fill.b, fillAlpha);
+    p.rect(x, y, w, h, radius);
+  }
+
   draw(p: p5) {
+    // Blit the cached static layer, rebuilding it only after a resize
+    if (!this.zoneLayer || this.zoneLayer.width !== p.width || this.zoneLayer.height !== p.height) {
+      this.zoneLayer?.remove();
+      this.zoneLayer = p.createGraphics(p.width, p.height);
+      this.zoneLayerValid = false;
+    }
+
+    if (!this.zoneLayerValid) {
+      this.renderZoneLayer(this.zoneLayer);
+      this.zoneLayerValid = true;
+    }
+
+    p.image(this.zoneLayer, 0, 0);
+  }
+
+  // Render all zones into the offscreen layer
+  private renderZoneLayer(p: p5.Graphics) {
+    p.clear();
     p.push();
 
     //Stroke Parameters
@@ -197,88 +243,49 @@ export class ZoneDisplay {
     p.strokeWeight(sw*.8);
     const strokeOffset = sw/2;
     const stroke_weight_comp = 1.25*sw;
-
+    const envWidth = this.environment.environment_width_px;
+    const envHeight = this.environment.environment_height_px;
+    const radius = this.environment.environment_border_radius_px;
 
     //Target Berm Zone
-    const color_tz = this.targetbermZone_color;
-    const rgb_tz = this.app.hexToRgb(color_tz) ?? { r: 0, g: 0, b: 0 };
-    const r_tz = rgb_tz.r;
-    const g_tz = rgb_tz.g;
-    const b_tz = rgb_tz.b;
-    const x_pos_tz = stroke_weight_comp + strokeOffset + this.environment.environment_width_px - this.constructionZone_width_px/2 - this.targetbermZone_width_px/2;
-    const y_pos_tz = this.environment.environment_height_px - this.targetbermZone_height_px - this.constructionZone_height_px/8;
-
-    p.stroke(r_tz, g_tz, b_tz, 255/2);
-    p.fill(r_tz, g_tz, b_tz, 255/2);
-    p.rect(x_pos_tz, strokeOffset + y_pos_tz, this.targetbermZone_width_px - stroke_weight_comp, this.targetbermZone_height_px , this.environment.environment_border_radius_px);
-
+    const rgb_tz = this.rgb_targetbermZone;
+    const x_pos_tz = stroke_weight_comp + strokeOffset + envWidth - this.constructionZone_width_px/2 - this.targetbermZone_width_px/2;
+    const y_pos_tz = envHeight - this.targetbermZone_height_px - this.constructionZone_height_px/8;
+    this.drawZoneRect(p, rgb_tz, 255/2, rgb_tz, 255/2,
+      x_pos_tz, strokeOffset + y_pos_tz, this.targetbermZone_width_px - stroke_weight_comp, this.targetbermZone_height_px, radius);
 
     //Construction Zone
-    const color_cz = this.constructionZone_color;
-    const rgb_cz = this.app.hexToRgb(color_cz) ?? { r: 0, g: 0, b: 0 };
-    const r_cz = rgb_cz.r;
-    const g_cz = rgb_cz.g;
-    const b_cz = rgb_cz.b;
-    const x_pos_cz = stroke_weight_comp + strokeOffset + this.environment.environment_width_px - this.constructionZone_width_px;
-    const y_pos_cz = this.environment.environment_height_px - this.constructionZone_height_px;
-
-    p.stroke(r_cz, g_cz, b_cz, 255);
-    p.fill(r_cz, g_cz, b_cz, 30);
-    p.rect(x_pos_cz, strokeOffset + y_pos_cz, this.constructionZone_width_px - stroke_weight_comp, this.constructionZone_height_px , this.environment.environment_border_radius_px);
-
+    const rgb_cz = this.rgb_constructionZone;
+    const x_pos_cz = stroke_weight_comp + strokeOffset + envWidth - this.constructionZone_width_px;
+    const y_pos_cz = envHeight - this.constructionZone_height_px;
+    this.drawZoneRect(p, rgb_cz, 255, rgb_cz, 30,
+      x_pos_cz, strokeOffset + y_pos_cz, this.constructionZone_width_px - stroke_weight_comp, this.constructionZone_height_px, radius);
 
     //Obstacle Zone
-    const color_oz = this.obstacleZone_color;
-    const rgb_oz = this.app.hexToRgb(color_oz) ?? { r: 0, g: 0, b: 0 };
-    const r_oz = rgb_oz.r;
-    const g_oz = rgb_oz.g;
-    const b_oz = rgb_oz.b;
-    const x_pos_oz = this.environment.environment_width_px - this.obstacleZone_width_px;
-    const y_pos_oz = this.environment.environment_height_px - this.obstacleZone_height_px;
-
-    p.stroke(r_oz, g_oz, b_oz, 255);
-    p.fill(r_oz, g_oz, b_oz, 30);
-    p.rect(x_pos_oz + strokeOffset + stroke_weight_comp, strokeOffset + y_pos_oz, this.obstacleZone_width_px - stroke_weight_comp, this.obstacleZone_height_px, this.environment.environment_border_radius_px);
-
+    const rgb_oz = this.rgb_obstacleZone;
+    const x_pos_oz = envWidth - this.obstacleZone_width_px;
+    const y_pos_oz = envHeight - this.obstacleZone_height_px;
+    this.drawZoneRect(p, rgb_oz, 255, rgb_oz, 30,
+      x_pos_oz + strokeOffset + stroke_weight_comp, strokeOffset + y_pos_oz, this.obstacleZone_width_px - stroke_weight_comp, this.obstacleZone_height_px, radius);
 
     //Excavation Zone
-    const color_ez = this.excavationZone_color;
-    const rgb_ez = this.app.hexToRgb(color_ez) ?? { r: 0, g: 0, b: 0 };
-    const r_ez = rgb_ez.r;
-    const g_ez = rgb_ez.g;
-    const b_ez = rgb_ez.b;
-    const y_pos_ez = this.environment.environment_height_px - this.excavationZone_height_px;
-
-    p.stroke(r_ez, g_ez, b_ez, 255);
-    p.fill(r_ez, g_ez, b_ez, 30);
-    p.rect(strokeOffset, strokeOffset + y_pos_ez, this.excavationZone_width_px - stroke_weight_comp, this.excavationZone_height_px, this.environment.environment_border_radius_px);
-
+    const rgb_ez = this.rgb_excavationZone;
+    const y_pos_ez = envHeight - this.excavationZone_height_px;
+    this.drawZoneRect(p, rgb_ez, 255, rgb_ez, 30,
+      strokeOffset, strokeOffset + y_pos_ez, this.excavationZone_width_px - stroke_weight_comp, this.excavationZone_height_px, radius);
 
     //Starting Zone
-    const color_sz = this.startingZone_color;
-    const rgb_sz = this.app.hexToRgb(color_sz) ?? { r: 0, g: 0, b: 0 };
-    const r_sz = rgb_sz.r;
-    const g_sz = rgb_sz.g;
-    const b_sz = rgb_sz.b;
-    const y_pos_sz = this.environment.environment_height_px - this.startingZone_height_px;
-
-    p.stroke(r_sz, g_sz, b_sz, 255);
-    p.fill(r_sz, g_sz, b_sz, 50);
-    p.rect(strokeOffset, strokeOffset + y_pos_sz, this.startingZone_width_px - stroke_weight_comp, this.startingZone_height_px , this.environment.environment_border_radius_px);
-
-
-    //Column Post Zone
-    const color_pz = this.columnZone_color;
-    const rgb_pz = this.app.hexToRgb(color_pz) ?? { r: 0, g: 0, b: 0 };
-    const r_pz = 150;
-    const g_pz = 150;
-    const b_pz = 150;
-    const x_pos_pz = this.environment.environment_width_px/2 - this.columnZone_height_px/2;
-    const y_pos_pz =  this.environment.environment_height_px/2 - this.columnZone_width_px/2;
-
-    p.stroke(r_pz, g_pz, b_pz, 255);
-    p.fill(255, 255, 255, 255);
-    p.rect(x_pos_pz, y_pos_pz, this.columnZone_width_px, this.columnZone_height_px, this.environment.environment_border_radius_px/2);
+    const rgb_sz = this.rgb_startingZone;
+    const y_pos_sz = envHeight - this.startingZone_height_px;
+    this.drawZoneRect(p, rgb_sz, 255, rgb_sz, 50,
+      strokeOffset, strokeOffset + y_pos_sz, this.startingZone_width_px - stroke_weight_comp, this.startingZone_height_px, radius);
+
+    //Column Post Zone (gray stroke, solid white fill)
+    const rgb_pz = { r: 150, g: 150, b: 150 };
+    const x_pos_pz = envWidth/2 - this.columnZone_height_px/2;
+    const y_pos_pz = envHeight/2 - this.columnZone_width_px/2;
+    this.drawZoneRect(p, rgb_pz, 255, { r: 255, g: 255, b: 255 }, 255,
+      x_pos_pz, y_pos_pz, this.columnZone_width_px, this.columnZone_height_px, radius/2);
 
     p.pop();
   }
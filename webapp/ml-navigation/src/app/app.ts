@@ -1,5 +1,5 @@
 // src/app/app.component.ts
-import { Component, HostListener, ViewChild, AfterViewInit, ChangeDetectorRef, NgZone, OnDestroy } from '@angular/core';
+import { Component, HostListener, ViewChild, AfterViewInit, ChangeDetectorRef, OnDestroy } from '@angular/core';
 import { RouterOutlet } from '@angular/router';
 import { EnvironmentComponent } from '../environment/environment';
 import { WindowSizeService } from './services/window-size';
@@ -12,6 +12,18 @@ import { Zone } from './enums/zone.enum';
 import { ResetTrigger } from './services/reset-trigger';
 import { Subscription } from 'rxjs';
 
+// Dig mode display rows never change — build them once at module load instead
+// of allocating fresh literals on every toggle/reset
+const DIG_MODE_OFF_PARAMS: Parameter[] = [{ name: 'Mode', value: 'OFF' }];
+const DIG_MODE_ON_PARAMS: Parameter[] = [{ name: 'Mode', value: 'ON' }];
+
+// hexToRgb is called from draw code every frame with a handful of distinct
+// palette colors — cache parses so repeat lookups skip the regex and parseInt
+const HEX_RGB_CACHE = new Map<string, { r: number; g: number; b: number } | null>();
+
+// Compiled once at module load so cache misses don't rebuild the pattern
+const HEX_COLOR_PATTERN = /^[0-9A-Fa-f]{6}$/;
+
 @Component({
   selector: 'app-root',
   standalone: true,
@@ -36,60 +48,57 @@ export class App implements AfterViewInit, OnDestroy {
   public positionParams_sigfig: number = 3;
   public currentZone: Zone = Zone.NONE;
   public digMode: boolean = false;
-  public digModeParams: Parameter[] = [
-    { name: 'Mode', value: 'OFF' }
-  ];
+  public digModeParams: Parameter[] = DIG_MODE_OFF_PARAMS;
   private resetSubscription?: Subscription;
+  private uiSyncHandle: number | null = null;
 
   constructor(
     private windowSizeService: WindowSizeService,
     private cdr: ChangeDetectorRef,
-    private ngZone: NgZone,
     private resetTrigger: ResetTrigger
   ) {
-    this.windowSizeService.updateWindowSize(this.window_width, this.window_height);
-  }
-
-  scaleRoverPosition(Axis: string, Coordinate: number): string {
-    const environment_height = this.environment.environment_height_px;
-    const environment_width = this.environment.environment_width_px;
-    const x_width_meters = this.environment.environment_width_meters;
-    const y_height_meters = this.environment.environment_height_meters;
-
-    let scaledCoordinate: number;
-
-    if (Axis === 'x') {
-      // Convert pixel coordinate to meters (0 to x_width_meters)
-      scaledCoordinate = (Coordinate / environment_width) * x_width_meters;
-    } else if (Axis === 'y') {
-      // Invert y-axis (canvas y=0 is top, we want y=0 at bottom)
-      // Then convert to meters (0 to y_height_meters)
-      scaledCoordinate = ((environment_height - Coordinate) / environment_height) * y_height_meters;
-    } else {
-      return '0';
-    }
-
-    return scaledCoordinate.toFixed(this.positionParams_sigfig);
+    // No initial updateWindowSize here: the service's BehaviorSubject is
+    // seeded with window.innerWidth/Height already, so re-emitting the same
+    // size at construction just made every subscriber recompute layout twice
   }
 
   getRoverPositionMeters(axis: 'x' | 'y'): string {
     if (!this.environment?.physicsEngine) return '—';
 
-    const state = this.environment.physicsEngine.getRoverState();
+    const state = this.environment.roverState;
     if (!state) return '—';
 
     const value = axis === 'x' ?
       this.environment.pixelsToMeters(state.x) :
-      this.environment.environment_height_meters - this.environment.pixelsToMeters(state.y);
+      this.environment.pixelsToMetersY(state.y);
 
     return value.toFixed(this.positionParams_sigfig);
   }
 
-  updateRoverPosition() {
-    this.positionParams = [
-      { name: 'x', value: this.getRoverPositionMeters('x') },
-      { name: 'y', value: this.getRoverPositionMeters('y') }
-    ];
+  // Raw rover position (pixels) behind the currently displayed strings
+  private lastRoverX = NaN;
+  private lastRoverY = NaN;
+
+  // Refresh the position display rows; returns whether anything changed so the
+  // sync loop can skip change detection on quiet frames. Compares the raw
+  // coordinates first so a stationary rover costs two number compares per
+  // frame instead of unit conversion plus toFixed allocations.
+  updateRoverPosition(): boolean {
+    const state = this.environment?.roverState;
+    if (!state) return false;
+
+    if (state.x === this.lastRoverX && state.y === this.lastRoverY) {
+      return false;
+    }
+    this.lastRoverX = state.x;
+    this.lastRoverY = state.y;
+
+    // Mutate the existing rows — the array and row objects keep their
+    // identity, so the display just rewrites two text bindings instead of
+    // tearing down and re-tracking fresh row objects every move
+    this.positionParams[0].value = this.getRoverPositionMeters('x');
+    this.positionParams[1].value = this.getRoverPositionMeters('y');
+    return true;
   }
 
   get detectedObstacles() {
@@ -111,53 +120,83 @@ export class App implements AfterViewInit, OnDestroy {
       this.resetDigMode();
     });
 
-    this.ngZone.runOutsideAngular(() => {
-      setInterval(() => {
-        if (this.environment) {
-          this.ngZone.run(() => {
-            const newRotation = this.environment.roverCurrentHeading;
-            const newSpeed = this.environment.roverCurrentSpeed;
-
-            if (Math.abs(this.rotationValue - newRotation) > 0.01 ||
-                Math.abs(this.speedValue - newSpeed) > 0.01) {
-              this.rotationValue = newRotation;
-              this.speedValue = newSpeed;
-            }
-
-            // Update position parameters
-            if (this.environment.rover) {
-              this.updateRoverPosition();
-              // Update current zone
-              this.currentZone = this.environment.currentZone;
-              this.cdr.markForCheck();
-            }
-          });
-        }
-      }, 50);
-    });
+    // Sync telemetry once per display frame instead of on a fixed interval:
+    // rAF batches our updates with the browser's paint, stops firing while the
+    // tab is hidden, and the dirty checks keep quiet frames nearly free. The
+    // app is zoneless, so no zone bookkeeping is needed — rAF callbacks don't
+    // trigger change detection; markForCheck schedules it explicitly.
+    const sync = () => {
+      this.syncTelemetry();
+      this.uiSyncHandle = requestAnimationFrame(sync);
+    };
+    this.uiSyncHandle = requestAnimationFrame(sync);
+  }
+
+  // Compare displayed telemetry against the environment and schedule change
+  // detection only when something moved
+  private syncTelemetry() {
+    if (!this.environment) return;
+
+    let changed = false;
+
+    const newRotation = this.environment.roverCurrentHeading;
+    const newSpeed = this.environment.roverCurrentSpeed;
+
+    if (Math.abs(this.rotationValue - newRotation) > 0.01 ||
+        Math.abs(this.speedValue - newSpeed) > 0.01) {
+      this.rotationValue = newRotation;
+      this.speedValue = newSpeed;
+      changed = true;
+    }
+
+    if (this.environment.rover) {
+      if (this.updateRoverPosition()) {
+        changed = true;
+      }
+      if (this.currentZone !== this.environment.currentZone) {
+        this.currentZone = this.environment.currentZone;
+        changed = true;
+      }
+    }
+
+    if (changed) {
+      this.cdr.markForCheck();
+    }
   }
 
   ngOnDestroy() {
+    if (this.uiSyncHandle !== null) {
+      cancelAnimationFrame(this.uiSyncHandle);
+    }
     if (this.resetSubscription) {
       this.resetSubscription.unsubscribe();
     }
   }
 
   hexToRgb(hex: string): { r: number; g: number; b: number } | null {
+  const cached = HEX_RGB_CACHE.get(hex);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   // Remove the leading # if present
-  hex = hex.replace(/^#/, '');
+  const stripped = hex.replace(/^#/, '');
+
+  let rgb: { r: number; g: number; b: number } | null = null;
 
   // Check if it's a valid 6-character hex string
-  if (hex.length !== 6 || !/^[0-9A-Fa-f]{6}$/.test(hex)) {
-    return null; // Invalid hex, return null or throw an error as needed
+  if (stripped.length === 6 && HEX_COLOR_PATTERN.test(stripped)) {
+    // Parse once, then mask out the r, g, b components
+    const value = parseInt(stripped, 16);
+    rgb = {
+      r: (value >> 16) & 0xff,
+      g: (value >> 8) & 0xff,
+      b: value & 0xff
+    };
   }
 
-  // Parse the r, g, b components
-  const r = parseInt(hex.substring(0, 2), 16);
-  const g = parseInt(hex.substring(2, 4), 16);
-  const b = parseInt(hex.substring(4, 6), 16);
-
-  return { r, g, b };
+  HEX_RGB_CACHE.set(hex, rgb);
+  return rgb;
 }
 
   // Generate random number in range
@@ -165,12 +204,24 @@ export class App implements AfterViewInit, OnDestroy {
     return min + Math.random() * (max - min);
   }
 
+  private resizeDebounceTimer: ReturnType<typeof setTimeout> | null = null;
+  private readonly resizeDebounceMs = 100; // Trailing-edge delay before propagating resize
+
   @HostListener('window:resize', ['$event'])
   onResize(event: Event) {
-    this.window_width = window.innerWidth;
-    this.window_height = window.innerHeight;
-    this.cell_size = this.window_height / this.grid_size;
-    this.windowSizeService.updateWindowSize(this.window_width, this.window_height);
+    // Browsers fire resize continuously while dragging; every emission makes
+    // subscribers recompute layout and resize the p5 canvas. Debounce so only
+    // the final size is propagated.
+    if (this.resizeDebounceTimer !== null) {
+      clearTimeout(this.resizeDebounceTimer);
+    }
+    this.resizeDebounceTimer = setTimeout(() => {
+      this.resizeDebounceTimer = null;
+      this.window_width = window.innerWidth;
+      this.window_height = window.innerHeight;
+      this.cell_size = this.window_height / this.grid_size;
+      this.windowSizeService.updateWindowSize(this.window_width, this.window_height);
+    }, this.resizeDebounceMs);
   }
 
   private lastKeyPressTime: number = 0;
@@ -189,9 +240,7 @@ export class App implements AfterViewInit, OnDestroy {
 
   resetDigMode() {
     this.digMode = false;
-    this.digModeParams = [
-      { name: 'Mode', value: 'OFF' }
-    ];
+    this.digModeParams = DIG_MODE_OFF_PARAMS;
 
     // Update physics bodies for all diggable objects
     if (this.environment?.diggingField) {
@@ -228,8 +277,6 @@ export class App implements AfterViewInit, OnDestroy {
     }
 
     // Update UI
-    this.digModeParams = [
-      { name: 'Mode', value: this.digMode ? 'ON' : 'OFF' }
-    ];
+    this.digModeParams = this.digMode ? DIG_MODE_ON_PARAMS : DIG_MODE_OFF_PARAMS;
   }
 }
\ No newline at end of file
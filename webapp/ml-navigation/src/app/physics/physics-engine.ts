@@ -7,6 +7,16 @@ export interface PhysicsObject {
   render?: (p: p5) => void;
 }
 
+// Rover pose/velocity as reported by getRoverState (visual center, degrees)
+export interface RoverState {
+  x: number;
+  y: number;
+  angle: number;
+  vx: number;
+  vy: number;
+  angularVelocity: number;
+}
+
 export class PhysicsEngine {
   private engine: Engine;
   private world: World;
@@ -14,9 +24,18 @@ export class PhysicsEngine {
   private roverBody: Body | null = null;
   private collisionCallback: (() => void) | null = null;
 
+  // Visual-center offset of the rover body. Kept here rather than as expando
+  // properties on the matter-js Body so engine bodies keep a uniform shape.
+  private roverOffsetX: number = 0;
+  private roverOffsetY: number = 0;
+
+  // Scratch vector reused for per-tick velocity writes; matter-js copies the
+  // components, so nothing retains a reference to it
+  private readonly scratchVelocity = { x: 0, y: 0 };
+
   // Physics settings
   private readonly PHYSICS_SCALE = 100; // pixels per meter
-  private readonly TIME_STEP = 1000 / 60; // 60 FPS
+  public readonly TIME_STEP = 1000 / 60; // 60 FPS
 
   constructor() {
     this.engine = Engine.create({
@@ -60,8 +79,8 @@ export class PhysicsEngine {
     });
 
     // Store the offset for later use
-    (this.roverBody as any).offsetX = offsetX;
-    (this.roverBody as any).offsetY = offsetY;
+    this.roverOffsetX = offsetX;
+    this.roverOffsetY = offsetY;
 
     World.add(this.world, this.roverBody);
     this.objects.set(this.roverBody.id, { body: this.roverBody, type: 'rover' });
@@ -151,16 +170,13 @@ export class PhysicsEngine {
   isRoverOverlappingDiggables(): boolean {
     if (!this.roverBody) return false;
 
-    const diggableBodies = Array.from(this.objects.entries())
-      .filter(([_, obj]) => obj.type === 'diggable')
-      .map(([_, obj]) => obj.body);
+    // Iterate the map directly — no intermediate arrays in this per-frame check
+    const roverBounds = this.roverBody.bounds;
+    for (const obj of this.objects.values()) {
+      if (obj.type !== 'diggable') continue;
 
-    for (const diggable of diggableBodies) {
       // Simple bounding box overlap check
-      const roverBounds = this.roverBody.bounds;
-      const diggableBounds = diggable.bounds;
-
-      // Check if bounds overlap
+      const diggableBounds = obj.body.bounds;
       if (roverBounds.max.x >= diggableBounds.min.x &&
           roverBounds.min.x <= diggableBounds.max.x &&
           roverBounds.max.y >= diggableBounds.min.y &&
@@ -182,7 +198,15 @@ export class PhysicsEngine {
   // Set rover velocity directly
   setRoverVelocity(vx: number, vy: number) {
     if (this.roverBody) {
-      Body.setVelocity(this.roverBody, { x: vx, y: vy });
+      // Common case while idle: commanded to stay stopped every tick.
+      // Setting zero onto an already-zero body is a no-op, so skip the call.
+      if (vx === 0 && vy === 0) {
+        const velocity = this.roverBody.velocity;
+        if (velocity.x === 0 && velocity.y === 0) return;
+      }
+      this.scratchVelocity.x = vx;
+      this.scratchVelocity.y = vy;
+      Body.setVelocity(this.roverBody, this.scratchVelocity);
     }
   }
 
@@ -196,17 +220,19 @@ export class PhysicsEngine {
   // Set rover angular velocity
   setRoverAngularVelocity(angularVelocity: number) {
     if (this.roverBody) {
+      // Same zero fast path as setRoverVelocity
+      if (angularVelocity === 0 && this.roverBody.angularVelocity === 0) return;
       Body.setAngularVelocity(this.roverBody, angularVelocity);
     }
   }
 
   // Get rover position and rotation (accounting for offset)
-  getRoverState() {
+  getRoverState(): RoverState | null {
     if (!this.roverBody) return null;
 
     // Get stored offset
-    const offsetX = (this.roverBody as any).offsetX || 0;
-    const offsetY = (this.roverBody as any).offsetY || 0;
+    const offsetX = this.roverOffsetX;
+    const offsetY = this.roverOffsetY;
 
     // Calculate the visual position by reversing the offset
     const angle = this.roverBody.angle;
@@ -224,7 +250,7 @@ export class PhysicsEngine {
   }
 
   // Update physics simulation
-  update(deltaTime: number = 16.67) {
+  update(deltaTime: number = this.TIME_STEP) {
     Engine.update(this.engine, deltaTime);
   }
 
@@ -235,16 +261,18 @@ export class PhysicsEngine {
     for (const pair of pairs) {
       const { bodyA, bodyB } = pair;
 
+      // Classify both bodies through the objects map — one id lookup each,
+      // instead of substring-matching the label strings
+      const objA = this.objects.get(bodyA.id);
+      const objB = this.objects.get(bodyB.id);
+      if (!objA || !objB) continue;
+
       // Check if rover is involved in collision
-      if (bodyA.label === 'rover' || bodyB.label === 'rover') {
-        const otherBody = bodyA.label === 'rover' ? bodyB : bodyA;
+      if (objA.type === 'rover' || objB.type === 'rover') {
+        const other = objA.type === 'rover' ? objB : objA;
 
         // Trigger callback for collisions with walls or obstacles
-        if (otherBody.label.includes('wall') || otherBody.label.includes('obstacle') ||
-            otherBody.label.includes('rock') || otherBody.label.includes('crater') ||
-            otherBody.label.includes('column')) {
-          console.log('Collision detected with:', otherBody.label);
-
+        if (other.type === 'wall' || other.type === 'obstacle') {
           // Trigger the reset callback
           if (this.collisionCallback) {
             this.collisionCallback();
@@ -290,8 +318,8 @@ export class PhysicsEngine {
   resetRover(x: number, y: number, angle: number = 0) {
     if (this.roverBody) {
       // Get stored offset
-      const offsetX = (this.roverBody as any).offsetX || 0;
-      const offsetY = (this.roverBody as any).offsetY || 0;
+      const offsetX = this.roverOffsetX;
+      const offsetY = this.roverOffsetY;
 
       // Apply rotation to the offset
       const angleRad = angle * Math.PI / 180;
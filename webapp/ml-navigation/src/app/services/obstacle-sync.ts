@@ -0,0 +1,18 @@
+import { Injectable } from '@angular/core';
+import { ReplaySubject } from 'rxjs';
+
+// Handshake between obstacle generation and physics setup: the obstacle field
+// announces each finished (re)generation, and the rover rebuilds its physics
+// bodies in response. Replay depth 1 so a subscriber that attaches after the
+// initial generation still receives the current layout.
+@Injectable({
+  providedIn: 'root'
+})
+export class ObstacleSync {
+  public generatedSubject = new ReplaySubject<void>(1);
+  generated$ = this.generatedSubject.asObservable();
+
+  notifyGenerated() {
+    this.generatedSubject.next();
+  }
+}
@@ -9,7 +9,7 @@ import { ZoneDisplay } from '../app/Components/zone_display/zone-display';
 import { ObstacleField } from '../app/Components/obstacle_field/obstacle-field';
 import { DiggingField } from '../app/Components/digging-field/digging-field';
 import { Frustum } from '../app/Components/frustum/frustum';
-import { PhysicsEngine } from '../app/physics/physics-engine';
+import { PhysicsEngine, RoverState } from '../app/physics/physics-engine';
 import { Zone } from '../app/enums/zone.enum';
 
 @Component({
@@ -32,6 +32,12 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
   public physicsEngine!: PhysicsEngine;
   app = inject(App);
 
+  // Rover state snapshot, produced once per simulation tick. Consumers (zone
+  // display, frustum, digging field, rover rendering, UI) read this instead of
+  // each calling physicsEngine.getRoverState(), which redoes the offset trig
+  // on every call.
+  public roverState: RoverState | null = null;
+
   // REAL-WORLD UNITS (METERS)
   public environment_width_meters: number = 6.8;
   public environment_height_meters: number = 5;
@@ -53,6 +59,13 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
   public grid_size = 50; // Grid divisions for visualization
   public xy_scale_factor: number = 8; // Window height scaling factor
 
+  // FIXED-TIMESTEP PHYSICS
+  private lastFrameTime: number = 0;       // Timestamp of previous simulation tick (ms)
+  private physicsAccumulator: number = 0;  // Unsimulated time carried between ticks (ms)
+  private readonly MAX_FRAME_TIME = 250;   // Clamp long stalls (tab switch, GC) to avoid spiral of death
+  private readonly MAX_SUBSTEPS = 5;       // Max physics steps per tick; excess backlog is dropped
+  private simulationTimer: ReturnType<typeof setInterval> | null = null;
+
 
   @ViewChild('canvasContainer', { static: true }) canvasContainer!: ElementRef;
   @ViewChild('rover', { static: true }) rover!: RoverComponent;
@@ -94,6 +107,21 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
     return pixels * (this.environment_height_meters / this.environment_height_px);
   }
 
+  // Coordinate conversion: world meters (origin bottom-left) <-> canvas pixels
+  // (origin top-left). Shared here so the flip-Y formula isn't repeated at
+  // every call site.
+  metersToPixelsX(meters: number): number {
+    return (meters / this.environment_width_meters) * this.environment_width_px;
+  }
+
+  metersToPixelsY(meters: number): number {
+    return this.environment_height_px - (meters / this.environment_height_meters) * this.environment_height_px;
+  }
+
+  pixelsToMetersY(pixels: number): number {
+    return this.pixelsToMeters(this.environment_height_px - pixels);
+  }
+
   // Randomize rover spawn within starting zone
   randomizeRoverSpawn(): void {
     // Zone dimensions from zone-display component
@@ -112,8 +140,8 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
     this.rover_start_rotation = randomIncrements * turnSpeed;
 
     // Update pixel coordinates
-    this.rover_start_x_px = (this.rover_start_x_meters / this.environment_width_meters) * this.environment_width_px;
-    this.rover_start_y_px = this.environment_height_px - ((this.rover_start_y_meters / this.environment_height_meters) * this.environment_height_px);
+    this.rover_start_x_px = this.metersToPixelsX(this.rover_start_x_meters);
+    this.rover_start_y_px = this.metersToPixelsY(this.rover_start_y_meters);
   }
 
   constructor(private windowSizeService: WindowSizeService) {
@@ -128,8 +156,8 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
     this.environment_stroke_weight_px = this.cell_size_px / 2;
 
     // Set initial pixel coordinates (will be randomized in ngOnInit)
-    this.rover_start_x_px = (this.rover_start_x_meters / this.environment_width_meters) * this.environment_width_px;
-    this.rover_start_y_px = this.environment_height_px - ((this.rover_start_y_meters / this.environment_height_meters) * this.environment_height_px);
+    this.rover_start_x_px = this.metersToPixelsX(this.rover_start_x_meters);
+    this.rover_start_y_px = this.metersToPixelsY(this.rover_start_y_meters);
   }
 
   ngOnInit() {
@@ -151,8 +179,8 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
       this.environment_height_px = (height * this.environment_height_meters / this.xy_scale_factor);
 
       // Convert meter-based starting position to pixel coordinates
-      this.rover_start_x_px = (this.rover_start_x_meters / this.environment_width_meters) * this.environment_width_px;
-      this.rover_start_y_px = this.environment_height_px - ((this.rover_start_y_meters / this.environment_height_meters) * this.environment_height_px);
+      this.rover_start_x_px = this.metersToPixelsX(this.rover_start_x_meters);
+      this.rover_start_y_px = this.metersToPixelsY(this.rover_start_y_meters);
 
       // Resize the p5.js canvas (add extra space for stroke)
       if (this.p5Instance) {
@@ -213,22 +241,10 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
         ctx.closePath();
         ctx.clip();
 
-        // Update physics engine
-        this.physicsEngine.update();
-
-        this.zoneDisplay.update(p);    // Update zone display
         this.zoneDisplay.draw(p);      // Render zone display
-
-        this.obstacleField.update(p);  // Update obstacle field
         this.obstacleField.draw(p);    // Render obstacles
-
-        this.diggingField.update();    // Update digging field
         this.diggingField.draw(p);     // Render diggable orbs
-
-        this.frustum.update(p);        // Update frustum
         this.frustum.draw(p);          // Render frustum (before rover so it's behind)
-
-        this.rover.update(p);          // Update rover
         this.rover.draw(p);            // Render rover
 
         ctx.restore(); // End clipping
@@ -251,9 +267,81 @@ export class EnvironmentComponent implements OnInit, OnDestroy {
         this.rover.keyReleased(event);
       };
     });
+
+    // Drive the simulation on its own timer so sim cadence is decoupled from
+    // canvas redraw: p.draw only renders, while this tick advances physics and
+    // component state. The accumulator keeps the step count correct even when
+    // setInterval fires late.
+    this.startSimulationTimer();
+
+    // Pause the simulation and rendering while the tab is hidden — nothing is
+    // visible and background timers are throttled anyway.
+    document.addEventListener('visibilitychange', this.handleVisibilityChange);
+  }
+
+  private startSimulationTimer() {
+    if (this.simulationTimer === null) {
+      this.simulationTimer = setInterval(() => this.stepSimulation(), this.physicsEngine.TIME_STEP);
+    }
+  }
+
+  private stopSimulationTimer() {
+    if (this.simulationTimer !== null) {
+      clearInterval(this.simulationTimer);
+      this.simulationTimer = null;
+    }
+  }
+
+  // Suspend/resume simulation and drawing on tab visibility changes
+  private handleVisibilityChange = () => {
+    if (document.hidden) {
+      this.stopSimulationTimer();
+      this.p5Instance?.noLoop();
+    } else {
+      // Discard time spent hidden so the sim resumes without a catch-up burst
+      this.lastFrameTime = 0;
+      this.physicsAccumulator = 0;
+      this.startSimulationTimer();
+      this.p5Instance?.loop();
+    }
+  };
+
+  // Advance physics and per-component simulation state by one tick
+  private stepSimulation() {
+    const now = performance.now();
+    if (this.lastFrameTime === 0) {
+      this.lastFrameTime = now;
+    }
+    const frameTime = Math.min(now - this.lastFrameTime, this.MAX_FRAME_TIME);
+    this.lastFrameTime = now;
+    this.physicsAccumulator += frameTime;
+
+    // Bounded catch-up: simulate at most MAX_SUBSTEPS fixed steps, then drop
+    // whatever backlog is left. After a long stall it's better to lose a few
+    // simulated frames than to burn this tick (and likely the next) replaying
+    // them while the UI stays frozen.
+    let substeps = 0;
+    while (this.physicsAccumulator >= this.physicsEngine.TIME_STEP && substeps < this.MAX_SUBSTEPS) {
+      this.physicsEngine.update(this.physicsEngine.TIME_STEP);
+      this.physicsAccumulator -= this.physicsEngine.TIME_STEP;
+      substeps++;
+    }
+    if (this.physicsAccumulator >= this.physicsEngine.TIME_STEP) {
+      this.physicsAccumulator = 0;
+    }
+
+    // Publish one rover-state snapshot for this tick before consumers run
+    this.roverState = this.physicsEngine.getRoverState();
+
+    this.zoneDisplay.update();     // Update zone display
+    this.diggingField.update();    // Update digging field
+    this.frustum.update();         // Update frustum
+    this.rover.update();           // Update rover
   }
 
   ngOnDestroy() {
+    document.removeEventListener('visibilitychange', this.handleVisibilityChange);
+    this.stopSimulationTimer();
     if (this.p5Instance) {
       this.p5Instance.remove();
     }